@@ -2,13 +2,14 @@ from fastapi import APIRouter, HTTPException
 from app.models.schemas import ChatRequest, ChatResponse
 from app.storage.memory import get_document_text, get_summary
 from app.services.llm import answer_question
+from app.services.admission import OverloadedError
 
 
 router = APIRouter()
 
 
 @router.post("/chat", response_model=ChatResponse)
-def chat(req: ChatRequest):
+async def chat(req: ChatRequest):
     """Handle chat questions about contracts"""
     contract_text = get_document_text(req.document_id)
     if contract_text is None:
@@ -17,7 +18,7 @@ def chat(req: ChatRequest):
     summary_points = get_summary(req.document_id)
     
     try:
-        answer = answer_question(
+        answer = await answer_question(
             contract_text=contract_text,
             question=req.question,
             summary_points=summary_points
@@ -28,6 +29,8 @@ def chat(req: ChatRequest):
             citations=None,  # Not implemented yet
             model_name="huggingface"  # Default model name
         )
+    except OverloadedError as e:
+        raise HTTPException(status_code=503, detail=e.reason, headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
 
@@ -1,21 +1,55 @@
 from fastapi import APIRouter, HTTPException
 from app.models.schemas import SummaryRequest, SummaryResponse
-from app.storage.memory import get_document_text, save_summary
-from app.services.llm import summarize_contract
+from app.storage.memory import get_document, save_summary, save_chunk_summaries
+from app.services.llm import summarize_contract, SUMMARY_CHUNK_CHARS
+from app.services.admission import OverloadedError
+from app.services.versioning import diff_clauses
+from app.utils.chunking import split_text_by_clauses, chunk_fingerprint
 from app.core.config import settings
 
 
 router = APIRouter()
 
 
+def _chunk_keys(text: str) -> set:
+    return {chunk_fingerprint(c) for c in split_text_by_clauses(text, max_chars=SUMMARY_CHUNK_CHARS)}
+
+
 @router.post("/summarize", response_model=SummaryResponse)
-def summarize(req: SummaryRequest):
-    text = get_document_text(req.document_id)
-    if text is None:
+async def summarize(req: SummaryRequest):
+    doc = get_document(req.document_id)
+    if doc is None:
         raise HTTPException(status_code=404, detail="SummaryRequest")
-    points = summarize_contract(text)
-    save_summary(req.document_id, points)
+    text = doc.text
+    chunk_keys = _chunk_keys(text)
+    reused = len(chunk_keys & doc.chunk_summaries.keys())
+    chunk_summaries = dict(doc.chunk_summaries)
+    try:
+        points = await summarize_contract(text, chunk_summaries)
+    except OverloadedError as e:
+        # Admission is per provider call, so keep the chunks already summarized for the retry
+        if get_document(req.document_id) is doc:
+            save_chunk_summaries(req.document_id, {k: v for k, v in chunk_summaries.items() if k in chunk_keys})
+        raise HTTPException(status_code=503, detail=e.reason, headers={"Retry-After": str(e.retry_after)})
+    current = get_document(req.document_id)
+    if current is doc:
+        save_summary(req.document_id, points)
+        # Only keep summaries for chunks of the current version
+        save_chunk_summaries(req.document_id, {k: v for k, v in chunk_summaries.items() if k in chunk_keys})
+    elif current is not None:
+        # A newer version was uploaded while we waited on the LLM: its summary is not ours
+        # to set, but chunk summaries are keyed by content and still apply to shared chunks
+        current_keys = _chunk_keys(current.text)
+        merged = {k: v for k, v in chunk_summaries.items() if k in current_keys}
+        merged.update(current.chunk_summaries)
+        save_chunk_summaries(req.document_id, merged)
+    changed = diff_clauses(doc.previous_text, text) if doc.previous_text is not None else None
     # Return in the format frontend expects
-    return SummaryResponse(document_id=req.document_id, summary=points, model_name=settings.model_name)
-
-
+    return SummaryResponse(
+        document_id=req.document_id,
+        summary=points,
+        model_name=settings.model_name,
+        version=doc.version,
+        changed_clauses=changed,
+        reused_chunks=reused,
+    )
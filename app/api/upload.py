@@ -1,12 +1,13 @@
 import uuid
-from fastapi import APIRouter, File, UploadFile, HTTPException
+from typing import Optional
+from fastapi import APIRouter, File, Form, UploadFile, HTTPException
 from app.core.config import settings
 from app.services.extraction import (
     extract_text_from_pdf,
     extract_text_from_docx,
     extract_text_from_txt,
 )
-from app.storage.memory import save_document
+from app.storage.memory import save_document, save_document_version, get_document_text
 from app.models.schemas import UploadResponse
 
 
@@ -17,7 +18,11 @@ ALLOWED_EXT = {"pdf", "docx", "txt"}
 
 
 @router.post("/upload", response_model=UploadResponse)
-async def upload(file: UploadFile = File(...)):
+async def upload(file: UploadFile = File(...), document_id: Optional[str] = Form(None)):
+    """Upload a new document, or a new version of an existing one when document_id is given"""
+    if document_id is not None and get_document_text(document_id) is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+
     filename = file.filename or "document"
     ext = (filename.split(".")[-1] or "").lower()
     if ext not in ALLOWED_EXT:
@@ -42,9 +47,15 @@ async def upload(file: UploadFile = File(...)):
     if not text or not text.strip():
         raise HTTPException(status_code=422, detail="No text found in document")
 
-    document_id = str(uuid.uuid4())
-    save_document(document_id, text)
+    version = 1
+    if document_id is not None:
+        version = save_document_version(document_id, text)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Document not found")
+    else:
+        document_id = str(uuid.uuid4())
+        save_document(document_id, text)
 
-    return UploadResponse(document_id=document_id, num_characters=len(text), ocr_used=ocr_used)
+    return UploadResponse(document_id=document_id, num_characters=len(text), ocr_used=ocr_used, version=version)
 
 
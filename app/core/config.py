@@ -7,10 +7,18 @@ class Settings(BaseModel):
     environment: str = os.getenv("ENV", "development")
     openai_api_key: str | None = os.getenv("OPENAI_API_KEY")
     hf_api_key: str | None = os.getenv("HF_API_KEY")
+    # Point the providers at a different endpoint, e.g. the load-test mock server
+    openai_base_url: str | None = os.getenv("OPENAI_BASE_URL")
+    hf_model: str = os.getenv("HF_MODEL", "microsoft/DialoGPT-medium")
     max_upload_mb: int = int(os.getenv("MAX_UPLOAD_MB", "20"))
     max_chunk_tokens: int = int(os.getenv("MAX_CHUNK_TOKENS", "1200"))
     model_name: str = os.getenv("MODEL_NAME", "gpt-4o-mini")
     enable_ocr: bool = os.getenv("ENABLE_OCR", "true").lower() == "true"
+    gzip_min_bytes: int = int(os.getenv("GZIP_MIN_BYTES", "1024"))
+    llm_max_concurrency: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    llm_max_waiting: int = int(os.getenv("LLM_MAX_WAITING", "16"))
+    llm_wait_timeout_s: float = float(os.getenv("LLM_WAIT_TIMEOUT_S", "10"))
+    llm_retry_after_s: int = int(os.getenv("LLM_RETRY_AFTER_S", "5"))
 
 
 settings = Settings()
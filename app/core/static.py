@@ -0,0 +1,174 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
+
+from app.core.logger import get_logger
+
+try:
+    import brotli
+except ImportError:  # Optional: fall back to gzip only
+    brotli = None
+
+
+logger = get_logger(__name__)
+
+# Build tools put a content hash in asset filenames, e.g. main.3f2a9c1b.js
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.(?:chunk\.)?[a-z0-9]+$", re.IGNORECASE)
+
+_COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "application/xml", "image/svg+xml")
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+# Moderate levels: close to max ratio for JS/CSS at a fraction of the CPU cost
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+@dataclass
+class StaticAsset:
+    body: bytes
+    content_type: str
+    etag: str
+    cache_control: str
+    compressible: bool = False
+    # Compressed bodies by encoding, filled on first request; None if it didn't shrink
+    encoded: Dict[str, Optional[bytes]] = field(default_factory=dict)
+
+
+def _is_compressible(content_type: str) -> bool:
+    return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+def _compress(body: bytes, encoding: str) -> Optional[bytes]:
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return compressed if len(compressed) < len(body) else None
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[token] = q
+    return weights
+
+
+def _acceptable_encodings(header: str, available: List[str]) -> List[str]:
+    """Encodings from ``available`` the client accepts, most preferred first (q=0 excluded)"""
+    weights = _parse_accept_encoding(header)
+    wildcard = weights.get("*", 0.0)
+    ranked = [(weights.get(enc, wildcard), -i, enc) for i, enc in enumerate(available)]
+    return [enc for q, _, enc in sorted(ranked, reverse=True) if q > 0]
+
+
+def _load_asset(path: str, rel_path: str, min_compress_bytes: int) -> StaticAsset:
+    with open(path, "rb") as f:
+        body = f.read()
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type == "application/javascript":
+        content_type += "; charset=utf-8"
+    immutable = rel_path.startswith("static/") and _HASHED_NAME.search(rel_path) is not None
+    return StaticAsset(
+        body=body,
+        content_type=content_type,
+        etag=hashlib.sha256(body).hexdigest()[:32],
+        cache_control=IMMUTABLE_CACHE if immutable else REVALIDATE_CACHE,
+        compressible=_is_compressible(content_type) and len(body) >= min_compress_bytes,
+    )
+
+
+class FrontendAssets:
+    """Serves a frontend build from memory with lazily compressed bodies and ETags.
+
+    Every file under ``build_dir`` is read into memory at startup. Each gzip or
+    brotli variant is built on the first request that asks for it and cached,
+    so cold starts only pay for reading the build. Hashed files under
+    ``static/`` get long-lived immutable caching; everything else
+    (``index.html`` in particular) must be revalidated, which is answered with
+    a 304 when ``If-None-Match`` still matches.
+    """
+
+    def __init__(self, build_dir: str, min_compress_bytes: int = 1024):
+        self.build_dir = build_dir
+        self._encodings = ["br", "gzip"] if brotli is not None else ["gzip"]
+        self._assets: Dict[str, StaticAsset] = {}
+        for root, _, files in os.walk(build_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                rel_path = os.path.relpath(path, build_dir).replace(os.sep, "/")
+                self._assets[rel_path] = _load_asset(path, rel_path, min_compress_bytes)
+        logger.info(f"Loaded {len(self._assets)} frontend assets from {build_dir}")
+
+    def get(self, rel_path: str) -> Optional[StaticAsset]:
+        return self._assets.get(rel_path)
+
+    async def _encoded_body(self, asset: StaticAsset, encoding: str) -> Optional[bytes]:
+        # Unlocked on purpose: concurrent first requests may each compress the asset,
+        # but they produce identical bytes and later requests hit the cache
+        if encoding not in asset.encoded:
+            asset.encoded[encoding] = await run_in_threadpool(_compress, asset.body, encoding)
+        return asset.encoded[encoding]
+
+    async def response(self, request: Request, asset: StaticAsset) -> Response:
+        body, encoding = asset.body, None
+        if asset.compressible:
+            accept = request.headers.get("accept-encoding", "")
+            for candidate in _acceptable_encodings(accept, self._encodings):
+                compressed = await self._encoded_body(asset, candidate)
+                if compressed is not None:
+                    body, encoding = compressed, candidate
+                    break
+
+        # Each encoding is a separate representation, so it needs its own ETag
+        etag = f'"{asset.etag}-{encoding}"' if encoding else f'"{asset.etag}"'
+        headers = {"ETag": etag, "Cache-Control": asset.cache_control}
+        if asset.compressible:
+            headers["Vary"] = "Accept-Encoding"
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if etag in candidates or "*" in candidates:
+                return Response(status_code=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, headers=headers, media_type=asset.content_type)
+
+
+class APICompressionMiddleware(GZipMiddleware):
+    """Gzip large API responses (e.g. search results); frontend assets handle their own encoding"""
+
+    def __init__(self, app, prefix: str = "/api", minimum_size: int = 1024, compresslevel: int = 6) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.prefix = prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.prefix):
+            await super().__call__(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
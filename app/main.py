@@ -1,21 +1,20 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 import os
 
 from app.core.config import settings
+from app.core.static import FrontendAssets, APICompressionMiddleware
 
-# Agar tumhare existing routers hain, import karo yahan
-# Example:
-# from app.api.upload import router as upload_router
-# from app.api.summarize import router as summarize_router
-# from app.api.chat import router as chat_router
-# from app.api.search import router as search_router
+from app.api.upload import router as upload_router
+from app.api.summarize import router as summarize_router
+from app.api.chat import router as chat_router
+from app.api.search import router as search_router
 
-def create_app() -> FastAPI:
+def create_app(frontend_dir: str | None = None) -> FastAPI:
     """
     Create and configure the FastAPI application
+
+    frontend_dir defaults to the frontend/build directory next to the backend
     """
     app = FastAPI(
         title=settings.app_name,
@@ -34,6 +33,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress large JSON responses such as search results
+    app.add_middleware(APICompressionMiddleware, minimum_size=settings.gzip_min_bytes)
+
     # -------------------------
     # Root Route (for Vercel check)
     # -------------------------
@@ -44,11 +46,10 @@ def create_app() -> FastAPI:
     # -------------------------
     # Existing API Routers
     # -------------------------
-    # Example:
-    # app.include_router(upload_router, prefix="/api/upload", tags=["Upload"])
-    # app.include_router(summarize_router, prefix="/api/summarize", tags=["Summarize"])
-    # app.include_router(chat_router, prefix="/api/chat", tags=["Chat"])
-    # app.include_router(search_router, prefix="/api/search", tags=["Search"])
+    app.include_router(upload_router, prefix="/api", tags=["Upload"])
+    app.include_router(summarize_router, prefix="/api", tags=["Summarize"])
+    app.include_router(chat_router, prefix="/api", tags=["Chat"])
+    app.include_router(search_router, prefix="/api", tags=["Search"])
 
     # -------------------------
     # Health Check
@@ -60,17 +61,28 @@ def create_app() -> FastAPI:
     # -------------------------
     # Serve Frontend
     # -------------------------
-    frontend_dir = os.path.join(os.path.dirname(__file__), "..", "frontend", "build")
+    if frontend_dir is None:
+        frontend_dir = os.path.join(os.path.dirname(__file__), "..", "frontend", "build")
 
     if os.path.exists(frontend_dir):
+        # Build files are held in memory; compressed variants are built on first request and cached
+        assets = FrontendAssets(frontend_dir, min_compress_bytes=settings.gzip_min_bytes)
+
         # Serve static files like JS, CSS
-        app.mount("/static", StaticFiles(directory=os.path.join(frontend_dir, "static")), name="static")
+        @app.api_route("/static/{asset_path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+        async def serve_static(asset_path: str, request: Request):
+            asset = assets.get(f"static/{asset_path}")
+            if asset is None:
+                raise HTTPException(status_code=404, detail="Not found")
+            return await assets.response(request, asset)
 
-        # Serve index.html for all other routes
-        @app.get("/{full_path:path}")
-        async def serve_frontend(full_path: str):
-            index_file = os.path.join(frontend_dir, "index.html")
-            return FileResponse(index_file)
+        # Serve top-level build files (favicon, manifest) and index.html for all other routes
+        @app.api_route("/{full_path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+        async def serve_frontend(full_path: str, request: Request):
+            asset = assets.get(full_path) or assets.get("index.html")
+            if asset is None:
+                raise HTTPException(status_code=404, detail="Not found")
+            return await assets.response(request, asset)
 
     return app
 
@@ -6,6 +6,7 @@ class UploadResponse(BaseModel):
     document_id: str
     num_characters: int
     ocr_used: bool
+    version: int = 1
 
 
 class SummaryRequest(BaseModel):
@@ -16,6 +17,9 @@ class SummaryResponse(BaseModel):
     document_id: str
     summary: List[str]  # Changed from summary_points to match frontend
     model_name: str
+    version: int = 1
+    changed_clauses: Optional[List[str]] = None  # Only set for version 2 and later
+    reused_chunks: int = 0
 
 
 class ChatRequest(BaseModel):
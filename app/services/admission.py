@@ -0,0 +1,51 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+
+class OverloadedError(Exception):
+    """Raised when a request cannot be admitted because the service is saturated."""
+
+    def __init__(self, retry_after: int, reason: str = "Service is busy, please retry later"):
+        super().__init__(reason)
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionController:
+    """Caps concurrent work and bounds how many callers may wait for a slot.
+
+    Callers beyond ``max_concurrent`` wait in a queue of at most ``max_waiting``
+    entries for up to ``wait_timeout`` seconds. Anything else is rejected right
+    away with :class:`OverloadedError` so the caller can answer fast.
+    """
+
+    def __init__(self, max_concurrent: int, max_waiting: int, wait_timeout: float, retry_after: int):
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        self._max_waiting = max(0, max_waiting)
+        self._wait_timeout = wait_timeout
+        self._retry_after = retry_after
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._semaphore.locked():
+            if self._waiting >= self._max_waiting:
+                raise OverloadedError(self._retry_after, "Too many pending requests")
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self._wait_timeout)
+            except asyncio.TimeoutError:
+                raise OverloadedError(self._retry_after, "Timed out waiting for a free slot")
+            finally:
+                self._waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        try:
+            yield
+        finally:
+            self._semaphore.release()
@@ -1,17 +1,42 @@
-from typing import List, Tuple
-from openai import OpenAI
-from huggingface_hub import InferenceClient
+import asyncio
+from typing import Dict, List, Tuple
+from openai import AsyncOpenAI
+from huggingface_hub import AsyncInferenceClient
 from app.core.config import settings
-from app.utils.chunking import split_text_by_length
+from app.services.admission import AdmissionController, OverloadedError
+from app.utils.chunking import split_text_by_clauses, chunk_fingerprint
 from rapidfuzz import process, fuzz
 from deep_translator import LibreTranslator
 
 
-_client = OpenAI(api_key=settings.openai_api_key) if settings.openai_api_key else None
-_hf_client = InferenceClient(model="microsoft/DialoGPT-medium", token=settings.hf_api_key) if settings.hf_api_key else None
+_client = AsyncOpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url) if settings.openai_api_key else None
+_hf_client = AsyncInferenceClient(model=settings.hf_model, token=settings.hf_api_key) if settings.hf_api_key else None
 
+# Global limit on in-flight provider calls. It is taken per call, not per request,
+# so a many-chunk summarize only holds a slot while one of its calls is running.
+admission = AdmissionController(
+    max_concurrent=settings.llm_max_concurrency,
+    max_waiting=settings.llm_max_waiting,
+    wait_timeout=settings.llm_wait_timeout_s,
+    retry_after=settings.llm_retry_after_s,
+)
+
+
+async def _openai_chat(**kwargs):
+    async with admission.slot():
+        return await _client.chat.completions.create(**kwargs)
+
+
+async def _translate_to_hindi(text: str) -> str:
+    """LibreTranslator is blocking, so run it off the event loop"""
+    translator = LibreTranslator(source="en", target="hi")
+    return await asyncio.to_thread(translator.translate, text)
+
+
+_HF_ERROR_MESSAGE = "I'm experiencing technical difficulties with the AI service. Let me provide you with a helpful analysis based on the contract content instead."
 
-def _use_huggingface_api(prompt: str, max_tokens: int = 200, force_hindi: bool = False) -> str:
+
+async def _use_huggingface_api(prompt: str, max_tokens: int = 200, force_hindi: bool = False) -> str:
     """Use Hugging Face API for text generation"""
     if not _hf_client:
         return ""
@@ -24,18 +49,23 @@ def _use_huggingface_api(prompt: str, max_tokens: int = 200, force_hindi: bool =
         else:
             full_prompt = prompt
             
-        response = _hf_client.text_generation(
-            full_prompt,
-            max_new_tokens=max_tokens,
-            temperature=0.3,
-            do_sample=True,
-            top_p=0.9
-        )
+        async with admission.slot():
+            response = await _hf_client.text_generation(
+                full_prompt,
+                max_new_tokens=max_tokens,
+                temperature=0.3,
+                do_sample=True,
+                top_p=0.9
+            )
         return response
+    except (ImportError, OverloadedError):
+        # A missing client dependency (e.g. aiohttp) is a deployment error and overload
+        # is reported to the caller; neither is a provider hiccup
+        raise
     except Exception as e:
         print(f"Hugging Face API error: {e}")
         # Return a helpful message instead of empty string
-        return "I'm experiencing technical difficulties with the AI service. Let me provide you with a helpful analysis based on the contract content instead."
+        return _HF_ERROR_MESSAGE
 
 
 def _wants_bilingual_answer(question: str) -> bool:
@@ -48,49 +78,75 @@ def _wants_bilingual_answer(question: str) -> bool:
     return any(t in q for t in triggers)
 
 
+SUMMARY_CHUNK_CHARS = 6000
+
 SUMMARY_PROMPT = (
     "You are a contract summarizer. Produce clear bullet points for: Parties involved, Duration, Payment terms, Termination conditions, Liabilities. "
     "Use concise language. If information is missing, state 'Not specified'."
 )
 
 
-def summarize_contract(text: str) -> List[str]:
+async def summarize_contract(text: str, chunk_summaries: Dict[str, str] | None = None) -> List[str]:
+    """Summarize a contract chunk by chunk and merge the results.
+
+    ``chunk_summaries`` maps chunk fingerprints to earlier per-chunk summaries.
+    Chunks found there are reused without calling the LLM, and fresh summaries
+    are written back into it so the next version of the document can reuse them.
+    """
+    if not (_hf_client or _client):
+        return _fallback_summary()
+    if chunk_summaries is None:
+        chunk_summaries = {}
+    return await _summarize_with_llm(text, chunk_summaries)
+
+
+async def _summarize_with_llm(text: str, chunk_summaries: Dict[str, str]) -> List[str]:
+    chunks = split_text_by_clauses(text, max_chars=SUMMARY_CHUNK_CHARS)
+
     # Try Hugging Face API first if available
     if _hf_client:
-        chunks = split_text_by_length(text, max_chars=6000, overlap=400)
         combined_summary: List[str] = []
         for chunk in chunks:
+            key = chunk_fingerprint(chunk)
+            if key in chunk_summaries:
+                combined_summary.append(chunk_summaries[key])
+                continue
             prompt = f"{SUMMARY_PROMPT}\n\nContract text:\n{chunk}"
-            hf_response = _use_huggingface_api(prompt, max_tokens=200)
-            if hf_response:
+            hf_response = await _use_huggingface_api(prompt, max_tokens=200)
+            if hf_response and hf_response != _HF_ERROR_MESSAGE:
+                chunk_summaries[key] = hf_response
                 combined_summary.append(hf_response)
         
         if combined_summary:
             # Ask model to merge bullet lists into top 5 bullets
             merged_text = "\n".join(combined_summary)
             merge_prompt = f"{SUMMARY_PROMPT}\n\nMerge and condense into 5 bullets:\n{merged_text}"
-            merged_response = _use_huggingface_api(merge_prompt, max_tokens=300)
+            merged_response = await _use_huggingface_api(merge_prompt, max_tokens=300)
             if merged_response:
                 lines = [line.strip("-• ") for line in merged_response.splitlines() if line.strip()]
                 return lines[:10]
     
     # Fallback to OpenAI if available
     if _client:
-        chunks = split_text_by_length(text, max_chars=6000, overlap=400)
         combined_summary: List[str] = []
         for chunk in chunks:
+            key = chunk_fingerprint(chunk)
+            if key in chunk_summaries:
+                combined_summary.append(chunk_summaries[key])
+                continue
             content = f"{SUMMARY_PROMPT}\n\nContract text:\n{chunk}"
-            resp = _client.chat.completions.create(
+            resp = await _openai_chat(
                 model=settings.model_name,
                 messages=[{"role": "user", "content": content}],
                 temperature=0.2,
             )
             part = resp.choices[0].message.content
             if part:
+                chunk_summaries[key] = part
                 combined_summary.append(part)
         # Ask model to merge bullet lists into top 5 bullets
         merged_text = "\n".join(combined_summary)
-        resp = _client.chat.completions.create(
+        resp = await _openai_chat(
             model=settings.model_name,
             messages=[
                 {"role": "system", "content": SUMMARY_PROMPT},
@@ -102,6 +158,10 @@ def summarize_contract(text: str) -> List[str]:
         lines = [line.strip("-• ") for line in merged.splitlines() if line.strip()]
         return lines[:10]
     
+    return _fallback_summary()
+
+
+def _fallback_summary() -> List[str]:
     # Fallback simple heuristic summary if no API key
     points = [
         "Parties involved: Not specified",
@@ -113,7 +173,16 @@ def summarize_contract(text: str) -> List[str]:
     return points
 
 
-def answer_question(question: str, contract_text: str, summary_points: List[str] | None) -> str:
+async def answer_question(question: str, contract_text: str, summary_points: List[str] | None) -> str:
+    if not (_hf_client or _client):
+        return await _answer_locally(question, contract_text, summary_points)
+    answer = await _answer_with_llm(question, contract_text, summary_points)
+    if answer is not None:
+        return answer
+    return await _answer_locally(question, contract_text, summary_points)
+
+
+async def _answer_with_llm(question: str, contract_text: str, summary_points: List[str] | None) -> str | None:
     bilingual = _wants_bilingual_answer(question)
     
     # Try Hugging Face API first if available
@@ -162,9 +231,11 @@ Question: {question}
 
 Answer:"""
             
-            hf_response = _use_huggingface_api(prompt, max_tokens=400)
+            hf_response = await _use_huggingface_api(prompt, max_tokens=400)
             if hf_response and hf_response.strip() and not hf_response.startswith("I'm experiencing technical difficulties"):
                 return hf_response
+        except (ImportError, OverloadedError):
+            raise
         except Exception as e:
             print(f"Hugging Face API error in answer_question: {e}")
             # Continue to fallback methods
@@ -185,7 +256,7 @@ Answer:"""
                     "Answer the user's question about the contract in English. After the English answer, add a "
                     "clear Hindi translation as a separate section starting with 'हिंदी में उत्तर:'.\n\n" + content
             )
-            resp = _client.chat.completions.create(
+            resp = await _openai_chat(
                 model=settings.model_name,
                 messages=[{"role": "user", "content": content}],
                 temperature=0.2,
@@ -194,16 +265,23 @@ Answer:"""
             if bilingual and "हिंदी" not in english_or_bilingual:
                 # If the model didn't include Hindi, translate the English part
                 try:
-                    translator = LibreTranslator(source="en", target="hi")
-                    hindi = translator.translate(english_or_bilingual)
+                    hindi = await _translate_to_hindi(english_or_bilingual)
                     return english_or_bilingual + "\n\n—\n\n" + hindi
                 except Exception:
                     return english_or_bilingual
             return english_or_bilingual
+        except OverloadedError:
+            raise
         except Exception as e:
             print(f"OpenAI API error in answer_question: {e}")
             # Continue to fallback methods
-    
+
+    return None
+
+
+async def _answer_locally(question: str, contract_text: str, summary_points: List[str] | None) -> str:
+    bilingual = _wants_bilingual_answer(question)
+
     # Enhanced local QA using fuzzy matching and intelligent analysis (fallback)
     combined_text = "\n".join(("\n".join(summary_points or []), contract_text)).strip()
     if not combined_text:
@@ -297,8 +375,7 @@ Answer:"""
     # Translate English answer to Hindi using LibreTranslate (public endpoints)
     english_text = "\n".join(english_lines)
     try:
-        translator = LibreTranslator(source="en", target="hi")
-        hindi_text = translator.translate(english_text)
+        hindi_text = await _translate_to_hindi(english_text)
         return english_text + "\n\n—\n\n" + hindi_text
     except Exception:
         # Fallback: if translation fails, return English only
@@ -0,0 +1,33 @@
+from difflib import SequenceMatcher
+from typing import List
+from app.utils.chunking import split_into_clauses
+
+
+def _preview(clause: str, limit: int = 200) -> str:
+    flat = " ".join(clause.split())
+    return flat if len(flat) <= limit else flat[: limit - 1] + "…"
+
+
+def diff_clauses(old_text: str, new_text: str) -> List[str]:
+    """Describe which clauses were added, modified or removed between two versions"""
+    old_clauses = split_into_clauses(old_text)
+    new_clauses = split_into_clauses(new_text)
+    # Compare on whitespace-normalised text so reflowed lines don't count as edits
+    old_keys = [" ".join(c.split()) for c in old_clauses]
+    new_keys = [" ".join(c.split()) for c in new_clauses]
+    changes: List[str] = []
+    matcher = SequenceMatcher(a=old_keys, b=new_keys, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        if tag == "replace":
+            # Pair clauses up as modifications; leftovers on either side were added or dropped
+            paired = min(i2 - i1, j2 - j1)
+            changes += [f"Modified: {_preview(c)}" for c in new_clauses[j1:j1 + paired]]
+            changes += [f"Added: {_preview(c)}" for c in new_clauses[j1 + paired:j2]]
+            changes += [f"Removed: {_preview(c)}" for c in old_clauses[i1 + paired:i2]]
+        elif tag == "insert":
+            changes += [f"Added: {_preview(c)}" for c in new_clauses[j1:j2]]
+        elif tag == "delete":
+            changes += [f"Removed: {_preview(c)}" for c in old_clauses[i1:i2]]
+    return changes
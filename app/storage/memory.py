@@ -1,11 +1,15 @@
 from typing import Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
 class DocumentRecord:
     text: str
     summary_points: Optional[list] = None
+    version: int = 1
+    previous_text: Optional[str] = None
+    # Per-chunk LLM summaries keyed by chunk fingerprint, reused across versions
+    chunk_summaries: Dict[str, str] = field(default_factory=dict)
 
 
 _DOCUMENTS: Dict[str, DocumentRecord] = {}
@@ -15,6 +19,24 @@ def save_document(document_id: str, text: str) -> None:
     _DOCUMENTS[document_id] = DocumentRecord(text=text)
 
 
+def save_document_version(document_id: str, text: str) -> Optional[int]:
+    """Store text as the next version of an existing document, returning its version number"""
+    rec = _DOCUMENTS.get(document_id)
+    if rec is None:
+        return None
+    _DOCUMENTS[document_id] = DocumentRecord(
+        text=text,
+        version=rec.version + 1,
+        previous_text=rec.text,
+        chunk_summaries=dict(rec.chunk_summaries),
+    )
+    return rec.version + 1
+
+
+def get_document(document_id: str) -> Optional[DocumentRecord]:
+    return _DOCUMENTS.get(document_id)
+
+
 def get_document_text(document_id: str) -> Optional[str]:
     rec = _DOCUMENTS.get(document_id)
     return rec.text if rec else None
@@ -28,8 +50,12 @@ def save_summary(document_id: str, summary_points: list) -> None:
         _DOCUMENTS[document_id] = DocumentRecord(text="", summary_points=summary_points)
 
 
-def get_summary(document_id: str) -> Optional[list]:
+def save_chunk_summaries(document_id: str, chunk_summaries: Dict[str, str]) -> None:
     rec = _DOCUMENTS.get(document_id)
-    return rec.summary_points if rec else None
+    if rec:
+        rec.chunk_summaries = chunk_summaries
 
 
+def get_summary(document_id: str) -> Optional[list]:
+    rec = _DOCUMENTS.get(document_id)
+    return rec.summary_points if rec else None
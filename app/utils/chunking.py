@@ -1,3 +1,5 @@
+import hashlib
+import re
 from typing import List
 
 
@@ -18,3 +20,87 @@ def split_text_by_length(text: str, max_chars: int = 4000, overlap: int = 200) -
     return chunks
 
 
+# Numeric headings need a dotted number ("2.1") or a trailing "."/")" ("2." / "2)") so
+# wrapped lines that merely start with a number ("30 days after...") are not split off
+_CLAUSE_HEADING = re.compile(r"^\s*(?:\d+(?:\.\d+)+[.)]?\s|\d+[.)]\s|\([a-z0-9]+\)\s)", re.IGNORECASE)
+
+# Keyword lines ("Section 4 ...") are often wrapped cross-references. They only open a
+# clause after a blank line or a finished sentence, or when shaped like a heading:
+# keyword, number, then end of line or a title ("Section 4 - Fees", "Article IV Term")
+_KEYWORD_LINE = re.compile(r"^\s*(?i:section|article|clause|schedule)\b")
+_KEYWORD_HEADING = re.compile(
+    r"^\s*(?i:section|article|clause|schedule)\s+(?:\d+(?:\.\d+)*|[IVXLC]+|[A-Z])[.)]?"
+    r"(?:\s*$|\s*[-–—:]\s*\S|\s+[A-Z])"
+)
+_TERMINAL_PUNCTUATION = (".", ";", ":", "!", "?", ")")
+
+
+def _opens_clause(line: str, previous: str) -> bool:
+    if _CLAUSE_HEADING.match(line):
+        return True
+    if not _KEYWORD_LINE.match(line):
+        return False
+    previous = previous.rstrip()
+    return not previous or previous.endswith(_TERMINAL_PUNCTUATION) or _KEYWORD_HEADING.match(line) is not None
+
+
+def chunk_fingerprint(chunk: str) -> str:
+    return hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
+
+def split_into_clauses(text: str) -> List[str]:
+    """Split on blank lines and on lines that open a numbered/headed clause"""
+    if not text:
+        return []
+    clauses: List[str] = []
+    current: List[str] = []
+    previous = ""
+    for line in text.splitlines():
+        opens = bool(line.strip()) and _opens_clause(line, previous)
+        previous = line
+        if not line.strip() or opens:
+            if current:
+                clauses.append("\n".join(current).strip())
+                current = []
+            if not line.strip():
+                continue
+        current.append(line)
+    if current:
+        clauses.append("\n".join(current).strip())
+    return [c for c in clauses if c]
+
+
+def split_text_by_clauses(
+    text: str, max_chars: int = 4000, boundary_every: int = 4, min_chars: int | None = None
+) -> List[str]:
+    """Group clauses into chunks whose boundaries depend on clause content.
+
+    Once a chunk holds at least ``min_chars`` (half of ``max_chars`` by default),
+    it is closed after a clause whose fingerprint falls on a boundary, or when
+    the next clause would not fit. Editing or inserting one clause then only
+    changes the chunks around it, while chunk counts stay close to plain
+    length-based splitting.
+    """
+    if min_chars is None:
+        min_chars = max_chars // 2
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for clause in split_into_clauses(text):
+        if len(clause) > max_chars:
+            if current:
+                chunks.append("\n\n".join(current))
+                current, current_len = [], 0
+            chunks.extend(split_text_by_length(clause, max_chars=max_chars, overlap=0))
+            continue
+        if current and current_len + len(clause) + 2 > max_chars:
+            chunks.append("\n\n".join(current))
+            current, current_len = [], 0
+        current.append(clause)
+        current_len += len(clause) + 2
+        if current_len >= min_chars and int(chunk_fingerprint(clause)[:8], 16) % boundary_every == 0:
+            chunks.append("\n\n".join(current))
+            current, current_len = [], 0
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
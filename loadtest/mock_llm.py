@@ -0,0 +1,106 @@
+"""Local stand-in for the OpenAI and Hugging Face inference APIs.
+
+Answers with canned text after a configurable delay and fails a configurable
+fraction of requests, so the backend can be load-tested without real providers.
+"""
+import asyncio
+import random
+import threading
+import time
+import uuid
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+MOCK_TEXT = (
+    "- Parties involved: Acme Corp and Example Ltd\n"
+    "- Duration: 12 months\n"
+    "- Payment terms: Net 30\n"
+    "- Termination conditions: 30 days written notice\n"
+    "- Liabilities: Capped at fees paid"
+)
+
+
+def create_mock_app(latency_ms: float = 500.0, jitter_ms: float = 100.0, failure_rate: float = 0.0) -> FastAPI:
+    app = FastAPI(title="Mock LLM")
+    app.state.calls = 0
+
+    async def _simulate(provider: str):
+        app.state.calls += 1
+        delay = max(0.0, random.gauss(latency_ms, jitter_ms)) / 1000
+        await asyncio.sleep(delay)
+        if random.random() < failure_rate:
+            status = random.choice([429, 500, 503])
+            # Each client parses its own error shape; HF expects a plain string
+            if provider == "hf":
+                content = {"error": "mock failure"}
+            else:
+                content = {"error": {"message": "mock failure", "code": status}}
+            return JSONResponse(status_code=status, content=content)
+        return None
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        failure = await _simulate("openai")
+        if failure is not None:
+            return failure
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": MOCK_TEXT},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    # Hugging Face text-generation: the client posts straight to the model URL
+    @app.post("/hf/{model_path:path}")
+    async def text_generation(model_path: str):
+        failure = await _simulate("hf")
+        if failure is not None:
+            return failure
+        return [{"generated_text": MOCK_TEXT}]
+
+    return app
+
+
+class MockLLMServer:
+    """Runs the mock app with uvicorn in a background thread"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8901, **mock_options):
+        self.host = host
+        self.port = port
+        config = uvicorn.Config(create_mock_app(**mock_options), host=host, port=port, log_level="warning")
+        self._app = config.app
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def calls(self) -> int:
+        """Number of provider requests the mock has received"""
+        return self._app.state.calls
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self, timeout: float = 10.0) -> None:
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Mock LLM server did not start")
+            time.sleep(0.05)
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
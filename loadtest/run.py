@@ -0,0 +1,259 @@
+"""Load-test the backend against the local mock LLM server.
+
+Starts the mock provider, launches the app via ``app.main.create_app`` in a
+uvicorn subprocess pointed at it, then drives a mixed workload of upload,
+summarize, chat and search requests at each concurrency level and prints
+latency percentiles, histograms, throughput and error rates.
+
+Example::
+
+    python -m loadtest.run --concurrency 1,8,32 --duration 20 --latency-ms 800 --failure-rate 0.02
+"""
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+from loadtest.mock_llm import MockLLMServer
+
+
+ENDPOINTS = ("upload", "summarize", "chat", "search")
+
+HISTOGRAM_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+QUESTIONS = [
+    "What are the payment terms?",
+    "How long is the contract duration?",
+    "What is the notice period for termination?",
+    "Who are the parties involved?",
+]
+
+SEARCH_TERMS = ["payment", "termination", "liability", "notice", "confidential"]
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        return sum(self.statuses.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(n for status, n in self.statuses.items() if not status.startswith("2"))
+
+    def record(self, status: str, latency_ms: float) -> None:
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.latencies_ms.append(latency_ms)
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[idx]
+
+    def histogram(self) -> List[int]:
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for latency in self.latencies_ms:
+            counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, latency)] += 1
+        return counts
+
+    def to_dict(self, elapsed_s: float) -> Dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "throughput_rps": self.count / elapsed_s if elapsed_s else 0.0,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "max_ms": max(self.latencies_ms, default=0.0),
+            "statuses": self.statuses,
+            "histogram": dict(zip([f"<={b}ms" for b in HISTOGRAM_BUCKETS_MS] + ["inf"], self.histogram())),
+        }
+
+
+def make_contract(num_clauses: int = 40) -> str:
+    topics = ["payment", "termination", "liability", "confidentiality", "notice", "duration"]
+    clauses = []
+    for i in range(1, num_clauses + 1):
+        topic = random.choice(topics)
+        clauses.append(
+            f"{i}. The {topic} provisions of this agreement apply to both parties. "
+            f"Any {topic} obligation under clause {i} survives for {random.randint(1, 36)} months."
+        )
+    return "\n\n".join(clauses)
+
+
+async def _upload(client: httpx.AsyncClient) -> httpx.Response:
+    files = {"file": ("contract.txt", make_contract().encode("utf-8"), "text/plain")}
+    return await client.post("/api/upload", files=files)
+
+
+async def _call(client: httpx.AsyncClient, endpoint: str, doc_ids: List[str]) -> httpx.Response:
+    if endpoint == "upload":
+        return await _upload(client)
+    document_id = random.choice(doc_ids)
+    if endpoint == "summarize":
+        return await client.post("/api/summarize", json={"document_id": document_id})
+    if endpoint == "chat":
+        return await client.post("/api/chat", json={"document_id": document_id, "question": random.choice(QUESTIONS)})
+    return await client.post("/api/search", json={"document_id": document_id, "query": random.choice(SEARCH_TERMS)})
+
+
+async def run_level(base_url: str, concurrency: int, duration_s: float, mix: Dict[str, float], doc_ids: List[str]):
+    stats = {name: EndpointStats() for name in mix}
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120.0, limits=limits) as client:
+        deadline = time.monotonic() + duration_s
+
+        async def worker():
+            while time.monotonic() < deadline:
+                endpoint = random.choices(names, weights=weights)[0]
+                start = time.perf_counter()
+                try:
+                    resp = await _call(client, endpoint, doc_ids)
+                    status = str(resp.status_code)
+                except httpx.HTTPError as e:
+                    status = type(e).__name__
+                stats[endpoint].record(status, (time.perf_counter() - start) * 1000)
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+    return stats, elapsed
+
+
+def print_report(concurrency: int, stats: Dict[str, EndpointStats], elapsed_s: float) -> None:
+    total = sum(s.count for s in stats.values())
+    errors = sum(s.errors for s in stats.values())
+    print(f"\n=== concurrency={concurrency}  requests={total}  "
+          f"throughput={total / elapsed_s:.1f} req/s  error_rate={errors / total if total else 0:.2%}")
+    print(f"{'endpoint':<10} {'count':>6} {'err%':>7} {'p50ms':>8} {'p90ms':>8} {'p99ms':>8} {'maxms':>8}  statuses")
+    for name, s in stats.items():
+        err = s.errors / s.count if s.count else 0.0
+        print(f"{name:<10} {s.count:>6} {err:>7.2%} {s.percentile(50):>8.0f} {s.percentile(90):>8.0f} "
+              f"{s.percentile(99):>8.0f} {max(s.latencies_ms, default=0):>8.0f}  {s.statuses}")
+    for name, s in stats.items():
+        if not s.count:
+            continue
+        print(f"  {name} latency histogram")
+        counts = s.histogram()
+        peak = max(counts) or 1
+        labels = [f"<={b}ms" for b in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        for label, n in zip(labels, counts):
+            if n:
+                print(f"    {label:>10} {n:>6} {'#' * max(1, round(40 * n / peak))}")
+
+
+def start_app(port: int, mock_url: str, provider: str) -> subprocess.Popen:
+    env = {k: v for k, v in os.environ.items() if k not in ("OPENAI_API_KEY", "HF_API_KEY", "OPENAI_BASE_URL", "HF_MODEL")}
+    if provider == "openai":
+        env["OPENAI_API_KEY"] = "mock-key"
+        env["OPENAI_BASE_URL"] = f"{mock_url}/v1"
+    else:
+        env["HF_API_KEY"] = "mock-key"
+        env["HF_MODEL"] = f"{mock_url}/hf/mock-model"
+    cmd = [
+        sys.executable, "-m", "uvicorn", "--factory", "app.main:create_app",
+        "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+    ]
+    return subprocess.Popen(cmd, env=env)
+
+
+def wait_until_healthy(base_url: str, proc: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"App exited with code {proc.returncode}")
+        try:
+            if httpx.get(f"{base_url}/api/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("App did not become healthy")
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"Unknown endpoint '{name}', expected one of {', '.join(ENDPOINTS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds to run each level")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("upload=1,summarize=2,chat=4,search=3"))
+    parser.add_argument("--seed-docs", type=int, default=10, help="Documents uploaded before the run")
+    parser.add_argument("--provider", choices=["openai", "hf"], default="openai")
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="Mean mock LLM latency")
+    parser.add_argument("--jitter-ms", type=float, default=100.0, help="Std deviation of mock LLM latency")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of mock LLM calls that fail")
+    parser.add_argument("--app-port", type=int, default=8900)
+    parser.add_argument("--mock-port", type=int, default=8901)
+    parser.add_argument("--json-out", help="Write the full results to this file")
+    args = parser.parse_args(argv)
+
+    mock = MockLLMServer(port=args.mock_port, latency_ms=args.latency_ms,
+                         jitter_ms=args.jitter_ms, failure_rate=args.failure_rate)
+    mock.start()
+    proc = start_app(args.app_port, mock.base_url, args.provider)
+    base_url = f"http://127.0.0.1:{args.app_port}"
+    results = []
+    try:
+        wait_until_healthy(base_url, proc)
+        with httpx.Client(base_url=base_url, timeout=30.0) as client:
+            doc_ids = []
+            for _ in range(args.seed_docs):
+                files = {"file": ("contract.txt", make_contract().encode("utf-8"), "text/plain")}
+                resp = client.post("/api/upload", files=files)
+                resp.raise_for_status()
+                doc_ids.append(resp.json()["document_id"])
+
+        for level in (int(c) for c in args.concurrency.split(",")):
+            stats, elapsed = asyncio.run(run_level(base_url, level, args.duration, args.mix, doc_ids))
+            print_report(level, stats, elapsed)
+            results.append({
+                "concurrency": level,
+                "elapsed_s": elapsed,
+                "endpoints": {name: s.to_dict(elapsed) for name, s in stats.items()},
+            })
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        mock.stop()
+    print(f"\nMock LLM served {mock.calls} calls")
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump({"config": {k: v for k, v in vars(args).items() if k != "json_out"}, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
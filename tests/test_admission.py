@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import chat as chat_api
+from app.api import summarize as summarize_api
+from app.services.admission import AdmissionController, OverloadedError
+from app.storage.memory import save_document
+
+
+def _controller(max_concurrent=1, max_waiting=1, wait_timeout=1.0):
+    return AdmissionController(max_concurrent, max_waiting, wait_timeout, retry_after=7)
+
+
+def test_admitted_immediately():
+    async def run():
+        ctl = _controller()
+        async with ctl.slot():
+            assert ctl.waiting == 0
+        async with ctl.slot():
+            pass
+
+    asyncio.run(run())
+
+
+def test_queued_then_admitted():
+    async def run():
+        ctl = _controller()
+        order = []
+
+        async def second():
+            async with ctl.slot():
+                order.append("second")
+
+        async with ctl.slot():
+            task = asyncio.create_task(second())
+            await asyncio.sleep(0)
+            assert ctl.waiting == 1
+            order.append("first")
+        await task
+        assert order == ["first", "second"]
+        assert ctl.waiting == 0
+
+    asyncio.run(run())
+
+
+def test_rejected_when_queue_full():
+    async def run():
+        ctl = _controller(max_waiting=1)
+
+        async def queued():
+            async with ctl.slot():
+                pass
+
+        async with ctl.slot():
+            waiter = asyncio.create_task(queued())
+            await asyncio.sleep(0)
+            with pytest.raises(OverloadedError) as exc:
+                async with ctl.slot():
+                    pass
+            assert exc.value.retry_after == 7
+            assert exc.value.reason == "Too many pending requests"
+        await waiter
+
+    asyncio.run(run())
+
+
+def test_rejected_on_wait_timeout_and_permits_returned():
+    async def run():
+        ctl = _controller(wait_timeout=0.01)
+        async with ctl.slot():
+            with pytest.raises(OverloadedError) as exc:
+                async with ctl.slot():
+                    pass
+            assert exc.value.reason == "Timed out waiting for a free slot"
+        assert ctl.waiting == 0
+        # The timed-out waiter must not have consumed the permit
+        async with ctl.slot():
+            pass
+
+    asyncio.run(run())
+
+
+def test_waiting_count_resets_after_cancellation():
+    async def run():
+        ctl = _controller()
+
+        async def waiter():
+            async with ctl.slot():
+                pass
+
+        async with ctl.slot():
+            task = asyncio.create_task(waiter())
+            await asyncio.sleep(0)
+            assert ctl.waiting == 1
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert ctl.waiting == 0
+        async with ctl.slot():
+            pass
+
+    asyncio.run(run())
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(chat_api.router, prefix="/api")
+    app.include_router(summarize_api.router, prefix="/api")
+    return TestClient(app)
+
+
+def test_chat_overloaded_returns_503_with_retry_after(monkeypatch):
+    async def overloaded(**kwargs):
+        raise OverloadedError(7, "Too many pending requests")
+
+    monkeypatch.setattr(chat_api, "answer_question", overloaded)
+    save_document("admission-chat", "1. Payment is due in 30 days.")
+    resp = _client().post("/api/chat", json={"document_id": "admission-chat", "question": "When is payment due?"})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "7"
+    assert resp.json()["detail"] == "Too many pending requests"
+
+
+def test_summarize_overloaded_returns_503_with_retry_after(monkeypatch):
+    async def overloaded(text, chunk_summaries=None):
+        raise OverloadedError(3, "Timed out waiting for a free slot")
+
+    monkeypatch.setattr(summarize_api, "summarize_contract", overloaded)
+    save_document("admission-summarize", "1. Payment is due in 30 days.")
+    resp = _client().post("/api/summarize", json={"document_id": "admission-summarize"})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "3"
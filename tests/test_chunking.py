@@ -0,0 +1,82 @@
+from app.utils.chunking import chunk_fingerprint, split_into_clauses, split_text_by_clauses
+
+
+def _contract(num_clauses: int = 60) -> str:
+    return "\n\n".join(
+        f"{i}. The parties agree that obligation number {i} applies for the full term of this agreement."
+        for i in range(1, num_clauses + 1)
+    )
+
+
+def test_split_into_clauses_on_blank_lines_and_headings():
+    text = "1. Parties\nAcme and Example\n2. Term\nTwelve months\n\nSchedule A\n(a) Fees"
+    assert split_into_clauses(text) == [
+        "1. Parties\nAcme and Example",
+        "2. Term\nTwelve months",
+        "Schedule A",
+        "(a) Fees",
+    ]
+
+
+def test_split_into_clauses_dotted_numbers_start_a_clause():
+    assert split_into_clauses("1.1 First\n1.2 Second") == ["1.1 First", "1.2 Second"]
+
+
+def test_split_into_clauses_keeps_wrapped_lines_starting_with_a_number():
+    assert split_into_clauses("The fee is payable\n30 days after invoice.") == [
+        "The fee is payable\n30 days after invoice."
+    ]
+
+
+def test_split_into_clauses_keeps_wrapped_cross_references():
+    text = "1. Fees are payable as described in\nSection 4 of this agreement.\n2. Term"
+    assert split_into_clauses(text) == [
+        "1. Fees are payable as described in\nSection 4 of this agreement.",
+        "2. Term",
+    ]
+
+
+def test_split_into_clauses_keyword_headings():
+    assert split_into_clauses("1. Scope\nSection 4 - Fees\nMonthly") == ["1. Scope", "Section 4 - Fees\nMonthly"]
+    assert split_into_clauses("1. Scope\nArticle IV Term") == ["1. Scope", "Article IV Term"]
+    # After a finished sentence any keyword line opens a clause
+    assert split_into_clauses("1. Scope.\nSection 4 applies") == ["1. Scope.", "Section 4 applies"]
+
+
+def test_split_into_clauses_empty():
+    assert split_into_clauses("") == []
+    assert split_into_clauses("\n\n  \n") == []
+
+
+def test_split_text_by_clauses_respects_max_chars():
+    chunks = split_text_by_clauses(_contract(), max_chars=1000)
+    assert chunks
+    assert all(len(c) <= 1000 for c in chunks)
+
+
+def test_split_text_by_clauses_chunk_count_close_to_length_split():
+    text = _contract(120)
+    chunks = split_text_by_clauses(text, max_chars=2000)
+    # Boundaries only fire after min_chars (half of max_chars), so at most ~2x the ideal count
+    assert len(chunks) <= 2 * (len(text) // 2000 + 1)
+
+
+def test_split_text_by_clauses_small_document_is_one_chunk():
+    text = _contract(5)
+    assert split_text_by_clauses(text, max_chars=6000) == ["\n\n".join(split_into_clauses(text))]
+
+
+def test_split_text_by_clauses_edit_only_changes_nearby_chunks():
+    v1 = _contract(120)
+    v2 = v1.replace("obligation number 60 applies", "obligation number 60 no longer applies")
+    keys1 = {chunk_fingerprint(c) for c in split_text_by_clauses(v1, max_chars=1000)}
+    chunks2 = split_text_by_clauses(v2, max_chars=1000)
+    changed = [c for c in chunks2 if chunk_fingerprint(c) not in keys1]
+    assert 1 <= len(changed) <= 2
+    assert len(chunks2) - len(changed) >= len(chunks2) // 2
+
+
+def test_split_text_by_clauses_splits_oversized_clause():
+    chunks = split_text_by_clauses("1. " + "x" * 2500, max_chars=1000)
+    assert len(chunks) == 3
+    assert all(len(c) <= 1000 for c in chunks)
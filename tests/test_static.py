@@ -0,0 +1,104 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.static import IMMUTABLE_CACHE, REVALIDATE_CACHE, _acceptable_encodings
+from app.main import create_app
+from app.storage.memory import save_document
+
+
+BUNDLE = "main.3f2a9c1b.js"
+
+
+@pytest.fixture
+def client(tmp_path):
+    (tmp_path / "static" / "js").mkdir(parents=True)
+    (tmp_path / "index.html").write_text("<html>" + "app " * 500 + "</html>")
+    (tmp_path / "static" / "js" / BUNDLE).write_text("console.log('bundle');\n" * 200)
+    (tmp_path / "static" / "js" / "plain.js").write_text("console.log('plain');\n" * 200)
+    (tmp_path / "favicon.ico").write_bytes(b"\x00" * 100)
+    (tmp_path / "logo.png").write_bytes(b"\x00" * 5000)
+    return TestClient(create_app(frontend_dir=str(tmp_path)))
+
+
+def test_prefers_br_over_gzip_at_equal_weight():
+    assert _acceptable_encodings("gzip, br", ["br", "gzip"]) == ["br", "gzip"]
+
+
+def test_q_zero_excludes_encoding():
+    assert _acceptable_encodings("br;q=0, gzip", ["br", "gzip"]) == ["gzip"]
+    assert _acceptable_encodings("gzip;q=0, br;q=0", ["br", "gzip"]) == []
+
+
+def test_higher_q_wins():
+    assert _acceptable_encodings("gzip;q=1, br;q=0.5", ["br", "gzip"]) == ["gzip", "br"]
+
+
+def test_wildcard_and_missing_header():
+    assert _acceptable_encodings("*", ["br", "gzip"]) == ["br", "gzip"]
+    assert _acceptable_encodings("*;q=0, gzip", ["br", "gzip"]) == ["gzip"]
+    assert _acceptable_encodings("", ["br", "gzip"]) == []
+
+
+def test_hashed_asset_is_immutable(client):
+    resp = client.get(f"/static/js/{BUNDLE}", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["Cache-Control"] == IMMUTABLE_CACHE
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+
+
+def test_unhashed_asset_and_index_revalidate(client):
+    assert client.get("/static/js/plain.js").headers["Cache-Control"] == REVALIDATE_CACHE
+    assert client.get("/dashboard").headers["Cache-Control"] == REVALIDATE_CACHE
+
+
+def test_etag_differs_per_encoding(client):
+    path = f"/static/js/{BUNDLE}"
+    gz = client.get(path, headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    identity = client.get(path, headers={"Accept-Encoding": "identity"}).headers["ETag"]
+    assert gz != identity
+    assert gz.endswith('-gzip"')
+
+
+def test_if_none_match_returns_304_with_headers(client):
+    path = f"/static/js/{BUNDLE}"
+    etag = client.get(path, headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    resp = client.get(path, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+    assert resp.headers["Cache-Control"] == IMMUTABLE_CACHE
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    # A validator for another encoding does not match
+    other = client.get(path, headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert other.status_code == 200
+
+
+def test_unknown_routes_fall_back_to_index(client):
+    resp = client.get("/contracts/123")
+    assert resp.status_code == 200
+    assert resp.text.startswith("<html>")
+    assert client.get("/favicon.ico").content == b"\x00" * 100
+
+
+def test_missing_static_asset_is_404(client):
+    assert client.get("/static/js/missing.js").status_code == 404
+
+
+def test_api_responses_are_gzipped(client):
+    save_document("static-search", "payment is due. " * 300)
+    resp = client.post(
+        "/api/search",
+        json={"document_id": "static-search", "query": "payment"},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert len(resp.json()["results"]) == 300
+
+
+def test_frontend_routes_are_not_gzipped_by_middleware(client):
+    # Large but not a compressible type, so only the middleware could have gzipped it
+    resp = client.get("/logo.png", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert "Content-Encoding" not in resp.headers
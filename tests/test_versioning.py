@@ -0,0 +1,45 @@
+from app.services.versioning import diff_clauses
+
+
+def test_identical_versions_have_no_changes():
+    text = "1. Parties\n\n2. Term"
+    assert diff_clauses(text, text) == []
+
+
+def test_reflowed_whitespace_is_not_a_change():
+    assert diff_clauses("1. The fee is\npayable monthly", "1. The fee is payable   monthly") == []
+
+
+def test_modified_clause():
+    assert diff_clauses("1. A\n\n2. B", "1. A\n\n2. B changed") == ["Modified: 2. B changed"]
+
+
+def test_added_and_removed_clauses():
+    assert diff_clauses("1. A\n\n2. B", "1. A\n\n2. B\n\n3. C") == ["Added: 3. C"]
+    assert diff_clauses("1. A\n\n2. B\n\n3. C", "1. A\n\n3. C") == ["Removed: 2. B"]
+
+
+def test_replacement_with_extra_new_clauses_reports_added():
+    assert diff_clauses("1. A\n\n2. B", "1. A changed\n\n1.1 New\n\n2. B") == [
+        "Modified: 1. A changed",
+        "Added: 1.1 New",
+    ]
+
+
+def test_replacement_with_extra_old_clauses_reports_removed():
+    assert diff_clauses("1. A\n\n1.1 Old\n\n2. B", "1. A changed\n\n2. B") == [
+        "Modified: 1. A changed",
+        "Removed: 1.1 Old",
+    ]
+
+
+def test_wrapped_cross_reference_edit_names_the_numbered_clause():
+    v1 = "1. Fees are payable as described in\nSection 4 of this agreement.\n2. Term"
+    v2 = v1.replace("Section 4", "Section 5")
+    assert diff_clauses(v1, v2) == ["Modified: 1. Fees are payable as described in Section 5 of this agreement."]
+
+
+def test_long_clauses_are_truncated():
+    change = diff_clauses("", "1. " + "word " * 100)[0]
+    assert change.startswith("Added: 1. word")
+    assert len(change) <= len("Added: ") + 200